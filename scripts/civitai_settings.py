@@ -1,5 +1,5 @@
 import gradio as gr
-from civitai_ext import actions, opencc_utils
+from civitai_ext import opencc_utils
 from modules import shared, script_callbacks
 
 
@@ -15,14 +15,22 @@ class OptionButton(shared.OptionInfo):
         self.do_not_save = True
 
 
+def lazy_action(name):
+    # defer importing actions (requests, PIL, cache, ...) until the button is clicked
+    def on_click():
+        from civitai_ext import actions
+        return getattr(actions, name)()
+    return on_click
+
+
 def on_ui_settings():
     section = ('civitai_link', "Civitai")
     # shared.opts.add_option("civitai_nsfw_previews", shared.OptionInfo(True, "Download NSFW (adult) preview images", section=section))
-    shared.opts.add_option("civitai_get_previews_metadata", OptionButton('get metadata and preview', actions.run_get_info, section=section))
-    shared.opts.add_option("civitai_get_metadata", OptionButton('get metadata', actions.load_info, section=section))
-    shared.opts.add_option("civitai_get_previews", OptionButton('get preview', actions.load_previews_v2, section=section))
+    shared.opts.add_option("civitai_get_previews_metadata", OptionButton('get metadata and preview', lazy_action('run_get_info'), section=section))
+    shared.opts.add_option("civitai_get_metadata", OptionButton('get metadata', lazy_action('load_info'), section=section))
+    shared.opts.add_option("civitai_get_previews", OptionButton('get preview', lazy_action('load_previews_v2'), section=section))
     shared.opts.add_option("civitai_convert_chinese", shared.OptionInfo('Disable', 'Convert chinese characters auto-generated description', gr.Dropdown, lambda: {'choices': opencc_utils.read_config()}, section=section, refresh=opencc_utils.install_opencc))
-    # shared.opts.add_option("civitai_re_preview", OptionButton('re download previews from cache', actions.re_download_preview_from_cache, section=section))
+    # shared.opts.add_option("civitai_re_preview", OptionButton('re download previews from cache', lazy_action('re_download_preview_from_cache'), section=section))
 
 
 script_callbacks.on_ui_settings(on_ui_settings)